@@ -49,7 +49,7 @@ class TokenAuthInterceptor(grpc.ServerInterceptor):
             logger.warning(f"Authentication failed: Invalid token for {handler_call_details.method}")
             return self._abort_unauthenticated("Invalid authentication token.")
 
-        logger.debug(f"Authentication successful for {handler_call_details.method}")
+        logger.debug("Authentication successful for %s", handler_call_details.method)
         return continuation(handler_call_details)
 
     def _abort_unauthenticated(self, message: str):
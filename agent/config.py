@@ -24,6 +24,7 @@ class AgentConfig:
             'server': {
                 'host': '0.0.0.0',
                 'port': 50051,
+                'unix_socket': None,
                 'max_workers': 10
             },
             'docker': {
@@ -74,6 +75,11 @@ class AgentConfig:
         """Get server port"""
         return int(os.getenv('DOCKYARD_PORT', self.config['server']['port']))
 
+    @property
+    def server_unix_socket(self) -> Optional[str]:
+        """Get Unix socket path to also listen on (None = TCP only)"""
+        return os.getenv('DOCKYARD_UNIX_SOCKET', self.config['server'].get('unix_socket'))
+
     @property
     def max_workers(self) -> int:
         """Get max workers"""
@@ -18,6 +18,17 @@ from agent.auth.token_validator import TokenValidator
 
 logger = get_logger(__name__)
 
+# Larger HTTP/2 flow-control window and frames for the streaming RPCs, so
+# log/exec output is not throttled to 64KiB per round trip
+SERVER_OPTIONS = [
+    ('grpc.http2.lookahead_bytes', 512 * 1024),
+    ('grpc.http2.max_frame_size', 1024 * 1024),
+    ('grpc.http2.bdp_probe', 1),
+    # Accept the CLI's 30s keepalive pings, also between calls
+    ('grpc.keepalive_permit_without_calls', 1),
+    ('grpc.http2.min_ping_interval_without_data_ms', 20000),
+]
+
 
 class DockyardServer:
     """gRPC server for Dockyard Agent"""
@@ -41,7 +52,8 @@ class DockyardServer:
 
             # Create server
             self.server = grpc.server(
-                futures.ThreadPoolExecutor(max_workers=self.config.max_workers)
+                futures.ThreadPoolExecutor(max_workers=self.config.max_workers),
+                options=SERVER_OPTIONS
             )
 
             # Add authentication interceptor if enabled
@@ -51,7 +63,8 @@ class DockyardServer:
                     interceptor = TokenAuthInterceptor(validator)
                     self.server = grpc.server(
                         futures.ThreadPoolExecutor(max_workers=self.config.max_workers),
-                        interceptors=(interceptor,)
+                        interceptors=(interceptor,),
+                        options=SERVER_OPTIONS
                     )
                     logger.info("Authentication enabled")
                 else:
@@ -64,6 +77,12 @@ class DockyardServer:
             address = f'{self.config.server_host}:{self.config.server_port}'
             self.server.add_insecure_port(address)
 
+            # Local clients can skip the TCP stack through a Unix socket
+            unix_socket = self.config.server_unix_socket
+            if unix_socket:
+                self.server.add_insecure_port(f'unix:{unix_socket}')
+                logger.info(f"Also listening on unix:{unix_socket}")
+
             # Start server
             self.server.start()
             logger.info(f"Agent started on {address}")
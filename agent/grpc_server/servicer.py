@@ -3,6 +3,9 @@ gRPC servicer implementation for Dockyard Agent
 """
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import grpc
 
 # Add parent directory to path for proto imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -10,6 +13,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 import dockyard_pb2
 import dockyard_pb2_grpc
 
+from agent.utils.errors import error_message
 from agent.utils.logger import get_logger
 from agent.services.container_service import ContainerService
 from agent.services.exec_service import ExecService
@@ -18,6 +22,9 @@ from agent.services.stats_service import StatsService
 
 logger = get_logger(__name__)
 
+# Containers stopped in parallel for a single BatchStop call
+BATCH_STOP_WORKERS = 16
+
 
 class DockyardServicer(dockyard_pb2_grpc.DockyardServiceServicer):
     """gRPC servicer for Dockyard operations"""
@@ -65,7 +72,7 @@ class DockyardServicer(dockyard_pb2_grpc.DockyardServiceServicer):
             logger.error(f"LaunchContainer failed: {e}")
             return dockyard_pb2.LaunchResponse(
                 success=False,
-                message=f"Failed to launch container: {str(e)}",
+                message=error_message("Failed to launch container", e),
                 container_id=''
             )
 
@@ -88,16 +95,39 @@ class DockyardServicer(dockyard_pb2_grpc.DockyardServiceServicer):
 
             return dockyard_pb2.StopResponse(
                 success=success,
-                message=message
+                message=message,
+                container_identifier=request.container_identifier
             )
 
         except Exception as e:
             logger.error(f"StopContainer failed: {e}")
             return dockyard_pb2.StopResponse(
                 success=False,
-                message=f"Failed to stop container: {str(e)}"
+                message=error_message("Failed to stop container", e),
+                container_identifier=request.container_identifier
             )
 
+    def BatchStop(self, request_iterator, context):
+        """Stop several containers over a single stream
+
+        Containers are stopped in parallel and each response is sent as
+        soon as its container has stopped.
+
+        Args:
+            request_iterator: Iterator of StopRequest
+            context: gRPC context
+
+        Yields:
+            StopResponse per request, in completion order
+        """
+        with ThreadPoolExecutor(max_workers=BATCH_STOP_WORKERS) as pool:
+            futures = [
+                pool.submit(self.StopContainer, request, context)
+                for request in request_iterator
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+
     def ExecContainer(self, request_iterator, context):
         """Execute command in container with bidirectional streaming
 
@@ -167,7 +197,7 @@ class DockyardServicer(dockyard_pb2_grpc.DockyardServiceServicer):
             yield dockyard_pb2.ExecResponse(
                 status=dockyard_pb2.ExecStatus(
                     success=False,
-                    message=f"Exec failed: {str(e)}",
+                    message=error_message("Exec failed", e),
                     finished=True
                 )
             )
@@ -182,6 +212,10 @@ class DockyardServicer(dockyard_pb2_grpc.DockyardServiceServicer):
         Yields:
             LogsResponse
         """
+        # Log text is highly repetitive, so gzip pays off on slow links
+        if request.compress:
+            context.set_compression(grpc.Compression.Gzip)
+
         try:
             for log_data in self.logs_service.get_logs(
                 container_identifier=request.container_identifier,
@@ -214,7 +248,7 @@ class DockyardServicer(dockyard_pb2_grpc.DockyardServiceServicer):
             yield dockyard_pb2.LogsResponse(
                 status=dockyard_pb2.LogsStatus(
                     success=False,
-                    message=f"Error: {str(e)}",
+                    message=error_message("Error", e),
                     finished=True
                 )
             )
@@ -255,7 +289,7 @@ class DockyardServicer(dockyard_pb2_grpc.DockyardServiceServicer):
             return dockyard_pb2.ListContainersResponse(
                 success=False,
                 containers=[],
-                message=f"Failed to list containers: {str(e)}"
+                message=error_message("Failed to list containers", e)
             )
 
     def InspectContainer(self, request, context):
@@ -284,7 +318,7 @@ class DockyardServicer(dockyard_pb2_grpc.DockyardServiceServicer):
             return dockyard_pb2.InspectContainerResponse(
                 success=False,
                 json_data='',
-                message=f"Failed to inspect container: {str(e)}"
+                message=error_message("Failed to inspect container", e)
             )
 
     def RemoveContainer(self, request, context):
@@ -314,7 +348,7 @@ class DockyardServicer(dockyard_pb2_grpc.DockyardServiceServicer):
             logger.error(f"RemoveContainer failed: {e}")
             return dockyard_pb2.RemoveContainerResponse(
                 success=False,
-                message=f"Failed to remove container: {str(e)}",
+                message=error_message("Failed to remove container", e),
                 container_id=''
             )
 
@@ -364,5 +398,5 @@ class DockyardServicer(dockyard_pb2_grpc.DockyardServiceServicer):
                 success=False,
                 stats=[],
                 timestamp='',
-                message=f"Failed to get stats: {str(e)}"
+                message=error_message("Failed to get stats", e)
             )
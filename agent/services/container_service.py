@@ -2,10 +2,9 @@
 Container service for Dockyard Agent
 Handles all container lifecycle operations
 """
-import json
-import yaml
 from pathlib import Path
 from typing import List, Dict, Any
+from agent.utils.errors import error_message
 from agent.utils.logger import get_logger
 from agent.utils.exceptions import (
     ContainerNotFoundException,
@@ -53,6 +52,7 @@ class ContainerService:
             if config_file:
                 config_path = Path(config_file)
                 if config_path.exists():
+                    import yaml
                     with open(config_path, 'r') as f:
                         config = yaml.safe_load(f)
                         container_config = self._parse_config(config)
@@ -90,7 +90,7 @@ class ContainerService:
 
         except Exception as e:
             logger.error(f"Failed to launch container: {e}")
-            return False, f"Failed to launch container: {str(e)}", None
+            return False, error_message("Failed to launch container", e), None
 
     def stop_container(
         self,
@@ -124,7 +124,7 @@ class ContainerService:
 
         except Exception as e:
             logger.error(f"Failed to stop container {container_identifier}: {e}")
-            return False, f"Failed to stop container: {str(e)}"
+            return False, error_message("Failed to stop container", e)
 
     def list_containers(self, all: bool = False) -> List[Dict[str, str]]:
         """List containers
@@ -139,30 +139,33 @@ class ContainerService:
             containers = self.docker_client.containers.list(all=all)
             container_list = []
 
+            # Bind helpers to locals for the per-container loop
+            _fp, _ts, _append = format_ports, truncate_string, container_list.append
+
             for container in containers:
-                # Format creation time
-                created_time = container.attrs['Created'][:19].replace('T', ' ')
+                attrs = container.attrs
+                image_obj = container.image
 
-                # Extract port information
-                port_info = format_ports(container.ports)
+                # Format creation time
+                created_time = attrs['Created'][:19].replace('T', ' ')
 
                 # Get image name
-                image = container.image.tags[0] if container.image.tags else container.image.id[:12]
+                tags = image_obj.tags
+                image = tags[0] if tags else image_obj.id[:12]
 
                 # Get command
-                cmd = container.attrs['Config']['Cmd'] or []
+                cmd = attrs['Config']['Cmd'] or []
                 command = ' '.join(cmd) if cmd else ''
 
-                container_info = {
+                _append({
                     'id': container.short_id,
                     'image': image,
-                    'command': truncate_string(command, 30),
+                    'command': _ts(command, 30),
                     'created': created_time,
                     'status': container.status,
-                    'ports': port_info,
+                    'ports': _fp(container.ports),
                     'names': container.name
-                }
-                container_list.append(container_info)
+                })
 
             logger.info(f"Listed {len(container_list)} containers (all={all})")
             return container_list
@@ -180,6 +183,8 @@ class ContainerService:
         Returns:
             JSON string of container inspection data
         """
+        import json
+
         try:
             container = self.docker_client.containers.get(container_identifier)
             inspection_data = container.attrs
@@ -221,7 +226,7 @@ class ContainerService:
 
         except Exception as e:
             logger.error(f"Failed to remove container {container_identifier}: {e}")
-            return False, f"Failed to remove container: {str(e)}", None
+            return False, error_message("Failed to remove container", e), None
 
     def _parse_config(self, config: dict) -> dict:
         """Parse YAML configuration to Docker container config
@@ -5,12 +5,29 @@ Handles container exec operations with bidirectional streaming
 import queue
 import threading
 from typing import Iterator, Any
+from agent.utils.errors import encode_error
 from agent.utils.logger import get_logger
 from agent.utils.exceptions import ContainerNotFoundException, ContainerOperationException
 
 logger = get_logger(__name__)
 
 
+def _error_frame(stderr: bytes) -> dict:
+    """Build the final output dictionary for a failed exec
+
+    Args:
+        stderr: Encoded error message
+
+    Returns:
+        Output dictionary with exit code -1
+    """
+    return {
+        'stdout': b'',
+        'stderr': stderr,
+        'exit_code': -1
+    }
+
+
 class ExecService:
     """Service for container exec operations"""
 
@@ -63,11 +80,7 @@ class ExecService:
 
         except Exception as e:
             logger.error(f"Failed to execute command: {e}")
-            yield {
-                'stdout': b'',
-                'stderr': str(e).encode(),
-                'exit_code': -1
-            }
+            yield _error_frame(encode_error(e))
 
     def _execute_simple(
         self,
@@ -126,11 +139,7 @@ class ExecService:
 
         except Exception as e:
             logger.error(f"Exec failed: {e}")
-            yield {
-                'stdout': b'',
-                'stderr': str(e).encode(),
-                'exit_code': -1
-            }
+            yield _error_frame(encode_error(e))
 
     def _execute_interactive(
         self,
@@ -257,8 +266,4 @@ class ExecService:
 
         except Exception as e:
             logger.error(f"Interactive exec failed: {e}")
-            yield {
-                'stdout': b'',
-                'stderr': str(e).encode(),
-                'exit_code': -1
-            }
+            yield _error_frame(encode_error(e))
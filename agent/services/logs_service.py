@@ -2,13 +2,26 @@
 Logs service for Dockyard Agent
 Handles container logs operations with streaming support
 """
+import io
+import queue
+import threading
+import time
 from typing import Iterator
 from datetime import datetime, timedelta
+from agent.utils.errors import encode_error
 from agent.utils.logger import get_logger
 from agent.utils.exceptions import ContainerNotFoundException
 
 logger = get_logger(__name__)
 
+# Follow mode coalescing: flush once this many bytes are buffered or once
+# the oldest buffered data has waited this many seconds
+LOG_CHUNK_SIZE = 64 * 1024
+LOG_FLUSH_INTERVAL = 0.05
+
+# Raw frames the reader thread may queue ahead of a slow consumer
+LOG_QUEUE_SIZE = 256
+
 
 class LogsService:
     """Service for container logs operations"""
@@ -52,32 +65,110 @@ class LogsService:
             # Parse 'since' parameter
             since_time = self._parse_since(since) if since else None
 
-            # Get logs
-            log_stream = container.logs(
-                stdout=stdout,
-                stderr=stderr,
-                stream=follow,
-                follow=follow,
-                timestamps=timestamps,
-                tail=tail if tail else 'all',
-                since=since_time
-            )
-
-            # Stream logs
             if follow:
-                # Streaming mode
-                for log_line in log_stream:
-                    yield log_line
+                # Streaming mode: read the raw API stream and batch small frames
+                log_stream = self.docker_client.api.logs(
+                    container.id,
+                    stdout=stdout,
+                    stderr=stderr,
+                    stream=True,
+                    follow=True,
+                    timestamps=timestamps,
+                    tail=tail if tail else 'all',
+                    since=since_time
+                )
+                yield from self._coalesce(log_stream)
             else:
                 # Non-streaming mode
-                yield log_stream
+                yield container.logs(
+                    stdout=stdout,
+                    stderr=stderr,
+                    stream=False,
+                    follow=False,
+                    timestamps=timestamps,
+                    tail=tail if tail else 'all',
+                    since=since_time
+                )
 
             logger.info(f"Logs streaming completed for {container_identifier}")
 
         except Exception as e:
             logger.error(f"Failed to get logs for {container_identifier}: {e}")
-            error_msg = f"Error: {str(e)}\n".encode()
-            yield error_msg
+            yield b'Error: %b\n' % encode_error(e)
+
+    def _coalesce(self, log_stream: Iterator[bytes]) -> Iterator[bytes]:
+        """Coalesce small log frames into larger chunks
+
+        Args:
+            log_stream: Raw log stream from the Docker API
+
+        Yields:
+            Log data chunks of up to LOG_CHUNK_SIZE bytes
+        """
+        chunk_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        stop_event = threading.Event()
+
+        def put(item) -> bool:
+            # Block while the consumer is behind, but give up once it is gone
+            while not stop_event.is_set():
+                try:
+                    chunk_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        # Thread to read the blocking Docker stream
+        def read_stream():
+            try:
+                for data in log_stream:
+                    if not put(data):
+                        break
+            except Exception as e:
+                if not stop_event.is_set():
+                    logger.error(f"Error reading log stream: {e}")
+            finally:
+                put(None)
+
+        reader_thread = threading.Thread(target=read_stream, daemon=True)
+        reader_thread.start()
+
+        buffer = io.BytesIO()
+        deadline = None
+
+        try:
+            while True:
+                timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+                try:
+                    data = chunk_queue.get(timeout=timeout)
+                except queue.Empty:
+                    data = b''
+
+                if data is None:
+                    break
+
+                if data:
+                    if deadline is None:
+                        deadline = time.monotonic() + LOG_FLUSH_INTERVAL
+                    buffer.write(data)
+
+                if buffer.tell() >= LOG_CHUNK_SIZE or (deadline is not None and time.monotonic() >= deadline):
+                    yield buffer.getvalue()
+                    buffer = io.BytesIO()
+                    deadline = None
+
+            # Flush remaining data
+            if buffer.tell():
+                yield buffer.getvalue()
+        finally:
+            stop_event.set()
+            # Unblocks the reader thread if it is waiting on the Docker socket
+            close = getattr(log_stream, 'close', None)
+            if close is not None:
+                try:
+                    close()
+                except Exception:
+                    pass
 
     def _parse_since(self, since: str):
         """Parse 'since' parameter to datetime or relative time
@@ -151,7 +151,7 @@ class StatsService:
             return 0.0
 
         except Exception as e:
-            logger.debug(f"Error calculating CPU percentage: {e}")
+            logger.debug("Error calculating CPU percentage: %s", e)
             return 0.0
 
     def _calculate_network_io(self, stats: dict) -> tuple:
@@ -164,18 +164,16 @@ class StatsService:
             Tuple of (rx_bytes, tx_bytes)
         """
         try:
-            networks = stats.get('networks', {})
-            rx_bytes = 0
-            tx_bytes = 0
+            networks = stats.get('networks') or {}
+            interfaces = networks.values()
 
-            for interface, data in networks.items():
-                rx_bytes += data.get('rx_bytes', 0)
-                tx_bytes += data.get('tx_bytes', 0)
+            rx_bytes = sum(data.get('rx_bytes', 0) for data in interfaces)
+            tx_bytes = sum(data.get('tx_bytes', 0) for data in interfaces)
 
             return rx_bytes, tx_bytes
 
         except Exception as e:
-            logger.debug(f"Error calculating network I/O: {e}")
+            logger.debug("Error calculating network I/O: %s", e)
             return 0, 0
 
     def _calculate_block_io(self, stats: dict) -> tuple:
@@ -189,19 +187,13 @@ class StatsService:
         """
         try:
             blkio_stats = stats.get('blkio_stats', {})
-            io_service_bytes = blkio_stats.get('io_service_bytes_recursive', [])
+            io_service_bytes = blkio_stats.get('io_service_bytes_recursive') or []
 
-            read_bytes = 0
-            write_bytes = 0
-
-            for entry in io_service_bytes:
-                if entry.get('op') == 'Read':
-                    read_bytes += entry.get('value', 0)
-                elif entry.get('op') == 'Write':
-                    write_bytes += entry.get('value', 0)
+            read_bytes = sum(entry.get('value', 0) for entry in io_service_bytes if entry.get('op') == 'Read')
+            write_bytes = sum(entry.get('value', 0) for entry in io_service_bytes if entry.get('op') == 'Write')
 
             return read_bytes, write_bytes
 
         except Exception as e:
-            logger.debug(f"Error calculating block I/O: {e}")
+            logger.debug("Error calculating block I/O: %s", e)
             return 0, 0
@@ -0,0 +1,28 @@
+"""
+Error message helpers for Dockyard Agent
+"""
+
+
+def encode_error(error) -> bytes:
+    """Encode an exception message, replacing unencodable characters
+
+    Args:
+        error: Exception or message
+
+    Returns:
+        UTF-8 encoded message
+    """
+    return str(error).encode('utf-8', 'replace')
+
+
+def error_message(prefix: str, error) -> str:
+    """Build a response message that is always valid for a protobuf string
+
+    Args:
+        prefix: Text describing the failed operation
+        error: Exception or message
+
+    Returns:
+        "prefix: message", with lone surrogates replaced
+    """
+    return f"{prefix}: {encode_error(error).decode('utf-8')}"
@@ -4,7 +4,16 @@ Logging configuration for Dockyard Agent
 import logging
 import logging.handlers
 import os
-from typing import Optional
+from typing import Optional, Set
+
+# Shared formatter for all handlers
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# Names of loggers already configured by setup_logger
+_CONFIGURED: Set[str] = set()
 
 
 def setup_logger(
@@ -12,7 +21,8 @@ def setup_logger(
     log_file: Optional[str] = None,
     log_level: str = 'INFO',
     max_bytes: int = 10485760,  # 10MB
-    backup_count: int = 3
+    backup_count: int = 3,
+    force: bool = False
 ) -> logging.Logger:
     """Setup and configure logger
 
@@ -22,12 +32,22 @@ def setup_logger(
         log_level: Logging level
         max_bytes: Maximum log file size before rotation
         backup_count: Number of backup files to keep
+        force: Reconfigure even if the logger was already set up
 
     Returns:
         Configured logger instance
+
+    Note:
+        Pass message arguments separately (``logger.debug("x: %s", x)``)
+        rather than as f-strings, so formatting is skipped for records
+        below the configured level.
     """
     logger = logging.getLogger(name)
 
+    # Already configured: keep the existing handlers
+    if name in _CONFIGURED and not force:
+        return logger
+
     # Clear existing handlers
     logger.handlers.clear()
 
@@ -35,16 +55,13 @@ def setup_logger(
     level = getattr(logging, log_level.upper(), logging.INFO)
     logger.setLevel(level)
 
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    # Handlers are attached here, so skip walking parent loggers
+    logger.propagate = False
 
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_FORMATTER)
     logger.addHandler(console_handler)
 
     # File handler with rotation
@@ -61,11 +78,12 @@ def setup_logger(
                 backupCount=backup_count
             )
             file_handler.setLevel(level)
-            file_handler.setFormatter(formatter)
+            file_handler.setFormatter(_FORMATTER)
             logger.addHandler(file_handler)
         except Exception as e:
-            logger.warning(f"Failed to setup file logging: {e}")
+            logger.warning("Failed to setup file logging: %s", e)
 
+    _CONFIGURED.add(name)
     return logger
 
 
@@ -0,0 +1,23 @@
+"""
+Dockyard CLI package
+"""
+import os
+import sys
+from importlib.util import find_spec
+
+# Make the generated dockyard_pb2 modules (written to the repository root by
+# `make proto`) importable once for the whole package
+_PROTO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROTO_DIR not in sys.path:
+    sys.path.append(_PROTO_DIR)
+
+# Prefer the C++ protobuf backend when it is installed. This has to happen
+# before the generated modules are first imported; an explicit setting in
+# the environment always wins, and newer protobuf releases that ship their
+# own compiled backend (and no pyext module) are left untouched.
+if 'PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION' not in os.environ:
+    try:
+        if find_spec('google.protobuf.pyext._message') is not None:
+            os.environ['PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION'] = 'cpp'
+    except ImportError:
+        pass
@@ -20,6 +20,12 @@ class TokenAuthClientInterceptor(
         """
         self.token_manager = token_manager
 
+        # Snapshot the auth metadata once instead of rebuilding it per RPC
+        if token_manager.has_token():
+            self._auth_md = (('authorization', token_manager.get_token()),)
+        else:
+            self._auth_md = ()
+
     def _add_auth_metadata(self, client_call_details):
         """Add authentication token to request metadata
 
@@ -29,33 +35,41 @@ class TokenAuthClientInterceptor(
         Returns:
             Modified client call details with auth metadata
         """
-        metadata = []
-        if client_call_details.metadata:
-            metadata = list(client_call_details.metadata)
+        if not self._auth_md:
+            return client_call_details
+
+        metadata = client_call_details.metadata
+        if not metadata:
+            # Nothing to merge: reuse the cached tuple as-is
+            return client_call_details._replace(metadata=self._auth_md)
+
+        return client_call_details._replace(metadata=tuple(metadata) + self._auth_md)
+
+    def _wrap(self, continuation, client_call_details, payload):
+        """Invoke the continuation with auth metadata attached
 
-        # Add authorization token if available
-        if self.token_manager.has_token():
-            token = self.token_manager.get_token()
-            metadata.append(('authorization', token))
+        Args:
+            continuation: Continuation function
+            client_call_details: Client call details
+            payload: Request or request iterator
 
-        return client_call_details._replace(metadata=metadata)
+        Returns:
+            Result of the continuation
+        """
+        return continuation(self._add_auth_metadata(client_call_details), payload)
 
     def intercept_unary_unary(self, continuation, client_call_details, request):
         """Intercept unary-unary calls"""
-        new_details = self._add_auth_metadata(client_call_details)
-        return continuation(new_details, request)
+        return self._wrap(continuation, client_call_details, request)
 
     def intercept_unary_stream(self, continuation, client_call_details, request):
         """Intercept unary-stream calls"""
-        new_details = self._add_auth_metadata(client_call_details)
-        return continuation(new_details, request)
+        return self._wrap(continuation, client_call_details, request)
 
     def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
         """Intercept stream-unary calls"""
-        new_details = self._add_auth_metadata(client_call_details)
-        return continuation(new_details, request_iterator)
+        return self._wrap(continuation, client_call_details, request_iterator)
 
     def intercept_stream_stream(self, continuation, client_call_details, request_iterator):
         """Intercept stream-stream calls"""
-        new_details = self._add_auth_metadata(client_call_details)
-        return continuation(new_details, request_iterator)
+        return self._wrap(continuation, client_call_details, request_iterator)
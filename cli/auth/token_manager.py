@@ -2,23 +2,31 @@
 Token management for Dockyard CLI
 """
 import os
-import yaml
 from typing import Optional
+from cli.config import DEFAULT_CONFIG_PATH, CLIConfig, load_yaml_cached, save_yaml
 from cli.utils.exceptions import AuthenticationException
 
 
 class TokenManager:
     """Manages authentication tokens for CLI"""
 
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None, config: Optional[CLIConfig] = None):
         """Initialize token manager
 
         Args:
             config_path: Path to config file
+            config: Already loaded CLIConfig to take the token from (optional)
         """
-        self.config_path = config_path or os.path.expanduser('~/.dockyard/config.yaml')
         self.token: Optional[str] = None
-        self.load_token()
+        self._config: Optional[dict] = None
+
+        if config is not None:
+            # Reuse the loaded configuration instead of reading the file again
+            self.config_path = config_path or config.config_path
+            self.token = config.auth_token
+        else:
+            self.config_path = config_path or DEFAULT_CONFIG_PATH
+            self.load_token()
 
     def load_token(self):
         """Load token from environment variable or config file
@@ -36,9 +44,8 @@ class TokenManager:
         # Priority 2: Config file
         if os.path.exists(self.config_path):
             try:
-                with open(self.config_path, 'r') as f:
-                    config = yaml.safe_load(f) or {}
-                    self.token = config.get('auth', {}).get('token')
+                self._config = load_yaml_cached(self.config_path)
+                self.token = self._config.get('auth', {}).get('token')
             except Exception as e:
                 pass
 
@@ -69,29 +76,20 @@ class TokenManager:
         # Ensure directory exists
         os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
 
-        # Load existing config
-        config = {}
-        if os.path.exists(self.config_path):
-            try:
-                with open(self.config_path, 'r') as f:
-                    config = yaml.safe_load(f) or {}
-            except Exception:
-                pass
+        # Load existing config unless load_token already did
+        if self._config is None:
+            self._config = {}
+            if os.path.exists(self.config_path):
+                try:
+                    self._config = load_yaml_cached(self.config_path)
+                except Exception:
+                    pass
 
         # Update auth section
-        if 'auth' not in config:
-            config['auth'] = {}
-        config['auth']['token'] = token
-
-        # Write to file
-        with open(self.config_path, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False)
-
-        # Set restrictive permissions
-        try:
-            os.chmod(self.config_path, 0o600)
-        except Exception:
-            pass  # Windows doesn't support chmod
+        self._config.setdefault('auth', {})['token'] = token
+
+        # Write to file (owner-only permissions)
+        save_yaml(self.config_path, self._config)
 
         self.token = token
 
@@ -1,68 +1,176 @@
 """
 gRPC client wrapper for Dockyard CLI
 """
-import sys
 import os
-import grpc
+import stat
+import threading
+from typing import Dict, List, Optional
 
-# Add parent directory to path for proto imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
-import dockyard_pb2
-import dockyard_pb2_grpc
-
-from cli.auth.interceptor import TokenAuthClientInterceptor
 from cli.auth.token_manager import TokenManager
+from cli.config import CLIConfig
 from cli.utils.exceptions import ConnectionException
 
+# Channel arguments tuned for the long-lived exec/logs/stats streams
+CHANNEL_OPTIONS = [
+    ('grpc.max_receive_message_length', 64 * 1024 * 1024),
+    ('grpc.keepalive_time_ms', 30000),
+    ('grpc.keepalive_timeout_ms', 5000),
+    ('grpc.keepalive_permit_without_calls', 1),
+    ('grpc.http2.max_pings_without_data', 0),
+    ('grpc.use_local_subchannel_pool', 1),
+    # Larger HTTP/2 flow-control window and frames so log/exec output is
+    # not throttled to 64KiB per round trip on non-local links
+    ('grpc.http2.lookahead_bytes', 512 * 1024),
+    ('grpc.http2.max_frame_size', 1024 * 1024),
+    ('grpc.http2.bdp_probe', 1),
+    # Read/write in 512KiB batches; larger sizes show diminishing returns
+    ('grpc.http2.write_buffer_size', 512 * 1024),
+    ('grpc.experimental.tcp_read_chunk_size', 512 * 1024),
+    ('grpc.experimental.tcp_max_read_chunk_size', 512 * 1024),
+]
+
+# Hosts for which a local Unix socket can replace the TCP connection
+LOCAL_HOSTS = ('localhost', '127.0.0.1', '::1')
+
+# Open channels shared between clients: target -> [channel, refcount]
+_CHANNELS: Dict[str, List] = {}
+_CHANNELS_LOCK = threading.Lock()
+
+
+def resolve_target(host: str, port: int, unix_socket: Optional[str] = None) -> str:
+    """Pick the gRPC target for an agent
+
+    Local agents are reached through their Unix socket when it exists,
+    which skips the loopback TCP stack; otherwise host:port is used.
+
+    Args:
+        host: Server hostname
+        port: Server port
+        unix_socket: Agent socket path (optional)
+
+    Returns:
+        gRPC target string
+    """
+    if unix_socket and host in LOCAL_HOSTS:
+        try:
+            if stat.S_ISSOCK(os.stat(unix_socket).st_mode):
+                return f"unix:{unix_socket}"
+        except OSError:
+            pass
+    return f"{host}:{port}"
+
+
+def acquire_channel(target: str):
+    """Get the shared channel for a target, creating it on first use
+
+    Args:
+        target: gRPC target (host:port or unix:path)
+
+    Returns:
+        grpc.Channel shared by every client of this target
+    """
+    import grpc
+
+    with _CHANNELS_LOCK:
+        entry = _CHANNELS.get(target)
+        if entry is None:
+            channel = grpc.insecure_channel(target, options=CHANNEL_OPTIONS)
+            entry = _CHANNELS[target] = [channel, 0]
+        entry[1] += 1
+        return entry[0]
+
+
+def release_channel(target: str):
+    """Drop a reference to a shared channel, closing it when unused
+
+    Args:
+        target: gRPC target passed to acquire_channel
+    """
+    with _CHANNELS_LOCK:
+        entry = _CHANNELS.get(target)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del _CHANNELS[target]
+
+    try:
+        entry[0].close()
+    except Exception:
+        pass
+
 
 class DockyardClient:
     """gRPC client for Dockyard operations"""
 
-    def __init__(self, host: str, port: int, timeout: int = 60):
+    def __init__(self, host: str, port: int, timeout: int = 60, config: Optional[CLIConfig] = None,
+                 use_unix_socket: bool = True):
         """Initialize gRPC client
 
         Args:
             host: Server hostname
             port: Server port
             timeout: Request timeout in seconds
+            config: Loaded CLIConfig to share with the token manager (optional)
+            use_unix_socket: Allow the configured Unix socket for local hosts;
+                pass False when the port was chosen explicitly
         """
         self.host = host
         self.port = port
         self.timeout = timeout
-        self.address = f"{host}:{port}"
 
-        # Initialize token manager
-        self.token_manager = TokenManager()
+        # Initialize token manager from a single config load
+        self.config = config or CLIConfig()
+        unix_socket = self.config.unix_socket if use_unix_socket else None
+        self.address = resolve_target(host, port, unix_socket)
+        self.token_manager = TokenManager(config=self.config)
 
-        # Create channel and stub
+        # The channel is opened on the first RPC
         self.channel = None
-        self.stub = None
-        self._connect()
+        self._stub = None
+        self._owns_channel = False
+
+    @property
+    def stub(self):
+        """gRPC stub, connecting to the agent on first use"""
+        if self._stub is None:
+            self._connect()
+        return self._stub
 
     def _connect(self):
         """Establish gRPC connection"""
+        # Deferred so that commands which never make an RPC skip loading grpc
+        import grpc
+        import dockyard_pb2_grpc
+
         try:
-            # Create channel
-            self.channel = grpc.insecure_channel(self.address)
+            # Reuse the connection of any other client talking to this agent
+            self.channel = acquire_channel(self.address)
+            self._owns_channel = True
 
-            # Add auth interceptor
-            auth_interceptor = TokenAuthClientInterceptor(self.token_manager)
-            self.channel = grpc.intercept_channel(self.channel, auth_interceptor)
+            # Add auth interceptor only when there is a token to attach
+            if self.token_manager.has_token():
+                from cli.auth.interceptor import TokenAuthClientInterceptor
+                auth_interceptor = TokenAuthClientInterceptor(self.token_manager)
+                self.channel = grpc.intercept_channel(self.channel, auth_interceptor)
 
             # Create stub
-            self.stub = dockyard_pb2_grpc.DockyardServiceStub(self.channel)
+            self._stub = dockyard_pb2_grpc.DockyardServiceStub(self.channel)
 
         except Exception as e:
             raise ConnectionException(f"Failed to connect to {self.address}: {e}")
 
     def close(self):
-        """Close gRPC connection"""
-        if self.channel:
-            try:
-                self.channel.close()
-            except Exception:
-                pass
+        """Release gRPC connection
+
+        The underlying channel is shared per agent and only closed once
+        the last client using it has been closed.
+        """
+        self._stub = None
+        if self._owns_channel:
+            self._owns_channel = False
+            release_channel(self.address)
 
     def __enter__(self):
         """Context manager entry"""
@@ -2,15 +2,12 @@
 Container management commands for Dockyard CLI
 """
 import sys
-import os
 import click
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 import dockyard_pb2
 
 from cli.commands.base import BaseCommand
-from cli.formatters.table import print_table
+from cli.formatters.table import stream_table
 from cli.formatters.utils import format_bytes
 
 
@@ -92,22 +89,14 @@ class ContainerCommands(BaseCommand):
                 click.echo("No containers found")
                 return
 
-            # Format as table
+            # Format as table, rendering rows as they are produced
             headers = ["CONTAINER ID", "IMAGE", "COMMAND", "CREATED", "STATUS", "PORTS", "NAMES"]
-            rows = []
-
-            for container in response.containers:
-                rows.append([
-                    container.id,
-                    container.image,
-                    container.command,
-                    container.created,
-                    container.status,
-                    container.ports,
-                    container.names
-                ])
+            rows = (
+                [c.id, c.image, c.command, c.created, c.status, c.ports, c.names]
+                for c in response.containers
+            )
 
-            print_table(headers, rows)
+            stream_table(headers, rows)
 
         except Exception as e:
             self.handle_error(e)
@@ -146,14 +135,13 @@ class ContainerCommands(BaseCommand):
             success_count = 0
             fail_count = 0
 
+            # Build the request once; only the identifier changes per call
+            request = dockyard_pb2.RemoveContainerRequest(force=force)
+
             for container_id in container_identifiers:
                 click.echo(f"Removing container '{container_id}'...")
 
-                request = dockyard_pb2.RemoveContainerRequest(
-                    container_identifier=container_id,
-                    force=force
-                )
-
+                request.container_identifier = container_id
                 response = self.client.stub.RemoveContainer(request)
 
                 if response.success:
@@ -1,16 +1,19 @@
 """
 Exec command for Dockyard CLI
 """
-import sys
 import os
+import selectors
+import sys
 import click
 import threading
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 import dockyard_pb2
 
 from cli.commands.base import BaseCommand
+from cli.utils.output import OutputBuffer
+
+# Maximum stdin bytes read at once and sent in a single ExecRequest
+STDIN_READ_SIZE = 64 * 1024
 
 
 class ExecCommand(BaseCommand):
@@ -56,27 +59,31 @@ class ExecCommand(BaseCommand):
         def request_iterator():
             yield dockyard_pb2.ExecRequest(start=start)
 
+        # Line-buffer on a terminal, batch otherwise
+        output = OutputBuffer(line_flush=sys.stdout.isatty())
+        write = output.write
+
         # Execute
-        for response in self.client.stub.ExecContainer(request_iterator()):
-            if response.HasField('status'):
-                if not response.status.success:
-                    click.echo(f"Error: {response.status.message}", err=True)
-                    sys.exit(1)
-                elif response.status.finished:
-                    sys.exit(response.status.exit_code)
-            elif response.HasField('output'):
-                if response.output.data:
-                    if response.output.stream_type == "stdout":
-                        sys.stdout.buffer.write(response.output.data)
-                        sys.stdout.flush()
-                    else:
-                        sys.stderr.buffer.write(response.output.data)
-                        sys.stderr.flush()
+        try:
+            for response in self.client.stub.ExecContainer(request_iterator()):
+                kind = response.WhichOneof('response_type')
+                if kind == 'status':
+                    if not response.status.success:
+                        output.flush()
+                        click.echo(f"Error: {response.status.message}", err=True)
+                        sys.exit(1)
+                    elif response.status.finished:
+                        sys.exit(response.status.exit_code)
+                elif kind == 'output':
+                    out = response.output
+                    data = out.data
+                    if data:
+                        write(data, stderr=out.stream_type != "stdout")
+        finally:
+            output.flush()
 
     def _execute_interactive(self, container_identifier, command, user, working_dir, environment):
         """Execute command in interactive mode with stdin support"""
-        import queue
-
         # Create exec start request
         start = dockyard_pb2.ExecStart(
             container_identifier=container_identifier,
@@ -87,50 +94,82 @@ class ExecCommand(BaseCommand):
             environment=environment or {}
         )
 
-        # Queue for stdin input
-        input_queue = queue.Queue()
         stop_event = threading.Event()
 
-        # Thread to read stdin
-        def read_stdin():
+        # select() only accepts sockets on Windows, so stdin is read by a
+        # thread there; elsewhere a self-pipe wakes the stdin selector when
+        # the session ends
+        wake_r = wake_w = None
+        if os.name != 'nt':
+            wake_r, wake_w = os.pipe()
+        wake_lock = threading.Lock()
+        selecting = False
+
+        def read_stdin_selector():
+            nonlocal selecting
+            # Take ownership of wake_r unless the session already ended
+            with wake_lock:
+                if stop_event.is_set():
+                    return
+                selecting = True
+
+            selector = selectors.DefaultSelector()
             try:
-                while not stop_event.is_set():
-                    try:
-                        data = sys.stdin.buffer.read(1024)
-                        if data:
-                            input_queue.put(data)
-                        else:
+                stdin_fd = sys.stdin.fileno()
+                selector.register(wake_r, selectors.EVENT_READ)
+                try:
+                    selector.register(stdin_fd, selectors.EVENT_READ)
+                except (ValueError, OSError):
+                    # stdin cannot be polled (e.g. redirected from a regular
+                    # file), but reading it never blocks, so send it all now
+                    while True:
+                        data = os.read(stdin_fd, STDIN_READ_SIZE)
+                        if not data:
                             break
-                    except Exception:
-                        break
-            except Exception:
-                pass
+                        yield dockyard_pb2.ExecRequest(
+                            input=dockyard_pb2.ExecInput(data=data)
+                        )
 
-        # Start stdin reader thread
-        stdin_thread = threading.Thread(target=read_stdin, daemon=True)
-        stdin_thread.start()
+                # Block until stdin has data or the session ends
+                while not stop_event.is_set():
+                    for key, _ in selector.select():
+                        if key.fd == wake_r:
+                            return
+
+                        data = os.read(stdin_fd, STDIN_READ_SIZE)
+                        if not data:
+                            # EOF: stop polling stdin but keep the session open
+                            selector.unregister(stdin_fd)
+                            continue
+
+                        yield dockyard_pb2.ExecRequest(
+                            input=dockyard_pb2.ExecInput(data=data)
+                        )
+            except (OSError, ValueError):
+                return
+            finally:
+                selector.close()
+                os.close(wake_r)
 
         # Create request iterator
         def request_iterator():
             # Send start request
             yield dockyard_pb2.ExecRequest(start=start)
 
-            # Send input from queue
-            while not stop_event.is_set():
-                try:
-                    data = input_queue.get(timeout=0.1)
-                    yield dockyard_pb2.ExecRequest(
-                        input=dockyard_pb2.ExecInput(data=data)
-                    )
-                except queue.Empty:
-                    continue
-                except Exception:
-                    break
+            if wake_r is None:
+                yield from self._read_stdin_threaded(stop_event)
+            else:
+                yield from read_stdin_selector()
+
+        # Interactive sessions echo keystrokes and prompts, so never hold output back
+        output = OutputBuffer(immediate=True)
+        write = output.write
 
         # Execute
         try:
             for response in self.client.stub.ExecContainer(request_iterator()):
-                if response.HasField('status'):
+                kind = response.WhichOneof('response_type')
+                if kind == 'status':
                     if not response.status.success:
                         click.echo(f"Error: {response.status.message}", err=True)
                         stop_event.set()
@@ -138,13 +177,57 @@ class ExecCommand(BaseCommand):
                     elif response.status.finished:
                         stop_event.set()
                         sys.exit(response.status.exit_code)
-                elif response.HasField('output'):
-                    if response.output.data:
-                        if response.output.stream_type == "stdout":
-                            sys.stdout.buffer.write(response.output.data)
-                            sys.stdout.flush()
-                        else:
-                            sys.stderr.buffer.write(response.output.data)
-                            sys.stderr.flush()
+                elif kind == 'output':
+                    out = response.output
+                    data = out.data
+                    if data:
+                        write(data, stderr=out.stream_type != "stdout")
         finally:
+            output.flush()
             stop_event.set()
+            if wake_w is not None:
+                try:
+                    os.write(wake_w, b'\0')
+                except OSError:
+                    pass
+                os.close(wake_w)
+                # The selector closes wake_r itself once it has started
+                with wake_lock:
+                    if not selecting:
+                        os.close(wake_r)
+
+    def _read_stdin_threaded(self, stop_event):
+        """Read stdin on a thread, for platforms whose select() cannot poll it
+
+        Args:
+            stop_event: Set when the session ends
+
+        Yields:
+            ExecRequest input messages
+        """
+        import queue
+
+        input_queue = queue.Queue()
+
+        def read_stdin():
+            try:
+                while not stop_event.is_set():
+                    # read1 returns whatever is available instead of
+                    # blocking until the full size has been read
+                    data = sys.stdin.buffer.read1(STDIN_READ_SIZE)
+                    if not data:
+                        break
+                    input_queue.put(data)
+            except Exception:
+                pass
+
+        threading.Thread(target=read_stdin, daemon=True).start()
+
+        while not stop_event.is_set():
+            try:
+                data = input_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            yield dockyard_pb2.ExecRequest(
+                input=dockyard_pb2.ExecInput(data=data)
+            )
@@ -2,14 +2,12 @@
 Logs command for Dockyard CLI
 """
 import sys
-import os
 import click
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 import dockyard_pb2
 
 from cli.commands.base import BaseCommand
+from cli.utils.output import OutputBuffer
 
 
 class LogsCommand(BaseCommand):
@@ -28,6 +26,13 @@ class LogsCommand(BaseCommand):
             no_stdout: Exclude stdout
             no_stderr: Exclude stderr
         """
+        # Followed logs show up immediately on a terminal and per line when
+        # piped; a one-shot dump is only flushed in large batches
+        output = OutputBuffer(
+            immediate=follow and sys.stdout.isatty(),
+            line_flush=follow
+        )
+
         try:
             request = dockyard_pb2.LogsRequest(
                 container_identifier=container_identifier,
@@ -40,20 +45,27 @@ class LogsCommand(BaseCommand):
             )
 
             # Stream logs
+            write = output.write
             for response in self.client.stub.GetLogs(request):
-                if response.HasField('log'):
+                kind = response.WhichOneof('response_type')
+                if kind == 'log':
                     # Log entry
-                    if response.log.data:
-                        sys.stdout.buffer.write(response.log.data)
-                        sys.stdout.flush()
-                elif response.HasField('status'):
+                    data = response.log.data
+                    if data:
+                        write(data)
+                elif kind == 'status':
                     # Status message
                     if not response.status.success:
+                        output.flush()
                         click.echo(f"Error getting logs: {response.status.message}", err=True)
                         sys.exit(1)
 
+            output.flush()
+
         except KeyboardInterrupt:
             # Graceful exit on Ctrl+C
+            output.flush()
             click.echo("\nLog streaming stopped", err=True)
         except Exception as e:
+            output.flush()
             self.handle_error(e)
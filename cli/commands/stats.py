@@ -2,16 +2,19 @@
 Stats command for Dockyard CLI
 """
 import sys
-import os
 import click
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from functools import lru_cache
 
 import dockyard_pb2
 
 from cli.commands.base import BaseCommand
 from cli.formatters.table import format_table
-from cli.formatters.utils import format_bytes
+from cli.formatters.utils import batched_ansi, format_bytes, redraw_screen, write_ansi
+
+STATS_HEADERS = ["CONTAINER", "NAME", "CPU %", "MEM USAGE / LIMIT", "MEM %", "NET I/O", "BLOCK I/O", "PIDS"]
+
+# Byte counters often repeat between ticks, so memoize their formatting
+_format_bytes = lru_cache(maxsize=4096)(format_bytes)
 
 
 class StatsCommand(BaseCommand):
@@ -47,7 +50,7 @@ class StatsCommand(BaseCommand):
                     return
 
                 # Format stats as table
-                self._display_stats(response.stats, clear_screen=not first_iteration and not no_stream)
+                self._display_stats(response.stats, clear=not first_iteration and not no_stream)
                 first_iteration = False
 
         except KeyboardInterrupt:
@@ -55,25 +58,20 @@ class StatsCommand(BaseCommand):
         except Exception as e:
             self.handle_error(e)
 
-    def _display_stats(self, stats, clear_screen=False):
+    def _display_stats(self, stats, clear=False):
         """Display statistics as formatted table
 
         Args:
             stats: List of ContainerStats
-            clear_screen: Clear screen before displaying
+            clear: Clear screen before displaying
         """
-        if clear_screen:
-            # Move cursor to top and clear screen
-            click.echo('\033[H\033[J', nl=False)
-
-        headers = ["CONTAINER", "NAME", "CPU %", "MEM USAGE / LIMIT", "MEM %", "NET I/O", "BLOCK I/O", "PIDS"]
         rows = []
 
         for stat in stats:
-            mem_usage = format_bytes(stat.memory_usage)
-            mem_limit = format_bytes(stat.memory_limit)
-            net_io = f"{format_bytes(stat.network_rx)} / {format_bytes(stat.network_tx)}"
-            block_io = f"{format_bytes(stat.block_read)} / {format_bytes(stat.block_write)}"
+            mem_usage = _format_bytes(stat.memory_usage)
+            mem_limit = _format_bytes(stat.memory_limit)
+            net_io = f"{_format_bytes(stat.network_rx)} / {_format_bytes(stat.network_tx)}"
+            block_io = f"{_format_bytes(stat.block_read)} / {_format_bytes(stat.block_write)}"
 
             rows.append([
                 stat.container_id,
@@ -86,5 +84,8 @@ class StatsCommand(BaseCommand):
                 str(stat.pids)
             ])
 
-        table = format_table(headers, rows)
-        click.echo(table)
+        # Emit the whole frame, escapes included, with a single write
+        with batched_ansi():
+            if clear:
+                redraw_screen()
+            write_ansi(format_table(STATS_HEADERS, rows) + "\n")
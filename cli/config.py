@@ -1,9 +1,148 @@
 """
 Configuration management for Dockyard CLI
 """
+import copy
 import os
-import yaml
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+# Default CLI config location, resolved once at import
+DEFAULT_CONFIG_PATH = os.path.expanduser('~/.dockyard/config.yaml')
+
+# Parsed CLI config persisted between invocations as JSON, tagged with the
+# source (path, st_mtime_ns, st_size) so YAML is only parsed after it changes
+CONFIG_CACHE_PATH = os.path.expanduser('~/.dockyard/.config.cache')
+
+# Parsed YAML files keyed by path, tagged with (st_mtime_ns, st_size)
+_YAML_CACHE: Dict[str, Tuple[Tuple[int, int], dict]] = {}
+
+
+def _yaml():
+    """Import PyYAML on first use
+
+    Returns:
+        Tuple of (yaml module, loader class, dumper class), preferring the
+        libyaml-backed classes when available
+    """
+    import yaml
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+    return yaml, loader, dumper
+
+
+def _atomic_write(path: str, dump, mode: str = 'w'):
+    """Atomically replace a file with owner-only (0600) permissions
+
+    Args:
+        path: Destination path
+        dump: Callable that writes the content to the open file object
+        mode: File mode ('w' or 'wb')
+    """
+    import tempfile
+
+    # mkstemp opens with O_CREAT | O_EXCL and mode 0600
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path) or '.',
+        prefix='.' + os.path.basename(path) + '.',
+        suffix='.tmp'
+    )
+    try:
+        with os.fdopen(fd, mode) as f:
+            dump(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _load_persisted(cache_path: str, tag: list) -> Optional[dict]:
+    """Read a parse result saved by _persist if it matches tag
+
+    The cache is only trusted if it is owned by the current user and not
+    accessible to anyone else.
+    """
+    import json
+
+    try:
+        with open(cache_path, 'r') as f:
+            st = os.fstat(f.fileno())
+            if st.st_mode & 0o077 or (hasattr(os, 'getuid') and st.st_uid != os.getuid()):
+                return None
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cached, dict) or cached.get('tag') != tag:
+        return None
+    data = cached.get('data')
+    return data if isinstance(data, dict) else None
+
+
+def _persist(cache_path: str, tag: list, data):
+    """Save a parse result for later invocations (best effort)
+
+    Only plain mappings that survive a JSON round trip unchanged are saved,
+    and never one holding an auth token, so the token stays in one file.
+    """
+    import json
+
+    if not isinstance(data, dict) or (data.get('auth') or {}).get('token'):
+        return
+    try:
+        payload = json.dumps({'tag': tag, 'data': data})
+        if json.loads(payload)['data'] != data:
+            return
+        _atomic_write(cache_path, lambda f: f.write(payload))
+    except Exception:
+        pass
+
+
+def load_yaml_cached(path: str, persist_path: Optional[str] = None) -> dict:
+    """Load a YAML file, reusing the parsed result while the file is unchanged
+
+    Args:
+        path: Path to YAML file
+        persist_path: File in which to also keep the parsed result across
+            processes (optional)
+
+    Returns:
+        Parsed YAML data (a private copy the caller may modify)
+    """
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+
+    cached = _YAML_CACHE.get(path)
+    if cached is None or cached[0] != key:
+        tag = [os.path.abspath(path), *key]
+        data = _load_persisted(persist_path, tag) if persist_path else None
+        if data is None:
+            yaml, loader, _ = _yaml()
+            with open(path, 'r') as f:
+                data = yaml.load(f, Loader=loader) or {}
+            if persist_path:
+                _persist(persist_path, tag, data)
+        cached = (key, data)
+        _YAML_CACHE[path] = cached
+
+    return copy.deepcopy(cached[1])
+
+
+def save_yaml(path: str, data: dict):
+    """Atomically write data to an owner-only (0600) YAML file
+
+    The data is written to a temporary file created with mode 0600 in the
+    same directory and then renamed over the target, so the file is never
+    world-readable or left truncated. Any cached parse is dropped.
+
+    Args:
+        path: Path to YAML file
+        data: Data to serialize
+    """
+    yaml, _, dumper = _yaml()
+    _YAML_CACHE.pop(path, None)
+    _atomic_write(path, lambda f: yaml.dump(data, f, default_flow_style=False, Dumper=dumper))
 
 
 class CLIConfig:
@@ -15,7 +154,7 @@ class CLIConfig:
         Args:
             config_path: Path to config file (default: ~/.dockyard/config.yaml)
         """
-        self.config_path = config_path or os.path.expanduser('~/.dockyard/config.yaml')
+        self.config_path = config_path or DEFAULT_CONFIG_PATH
         self.config = self._load_config()
 
     def _load_config(self) -> dict:
@@ -24,6 +163,7 @@ class CLIConfig:
             'default_host': 'localhost',
             'default_port': 50051,
             'timeout': 60,
+            'unix_socket': None,
             'output_format': 'table',
             'auth': {}
         }
@@ -31,10 +171,9 @@ class CLIConfig:
         # Try to load from file
         if os.path.exists(self.config_path):
             try:
-                with open(self.config_path, 'r') as f:
-                    file_config = yaml.safe_load(f) or {}
-                    # Merge with defaults
-                    return {**default_config, **file_config}
+                file_config = load_yaml_cached(self.config_path, CONFIG_CACHE_PATH)
+                # Merge with defaults
+                return {**default_config, **file_config}
             except Exception as e:
                 print(f"Warning: Failed to load config file: {e}")
                 return default_config
@@ -56,6 +195,14 @@ class CLIConfig:
         """Get timeout"""
         return self.config['timeout']
 
+    @property
+    def unix_socket(self) -> Optional[str]:
+        """Get agent Unix socket path, used instead of TCP for local agents
+
+        Opt-in: unset by default, so an explicit host/port is always honored.
+        """
+        return os.getenv('DOCKYARD_UNIX_SOCKET', self.config.get('unix_socket'))
+
     @property
     def output_format(self) -> str:
         """Get output format"""
@@ -89,12 +236,8 @@ class CLIConfig:
         # Ensure directory exists
         os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
 
-        # Write to file
-        with open(self.config_path, 'w') as f:
-            yaml.dump(self.config, f, default_flow_style=False)
-
-        # Set restrictive permissions
-        os.chmod(self.config_path, 0o600)
+        # Write to file (owner-only permissions)
+        save_yaml(self.config_path, self.config)
 
     def save_token(self, token: str):
         """Save authentication token to config file
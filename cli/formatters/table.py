@@ -1,55 +1,128 @@
 """
 Table formatter for Dockyard CLI
 """
-from typing import List
+import sys
+from itertools import chain, islice
+from typing import Iterable, Iterator, List
 
 
-def format_table(headers: List[str], rows: List[List[str]], min_width: int = 10) -> str:
-    """Format data as a table
+def _row_cells(row: Iterable, width: int) -> List[str]:
+    """Stringify a row, padded or cut to exactly width cells
+
+    Cells that already are strings are not converted again.
+    """
+    cells = [cell if type(cell) is str else str(cell) for cell in islice(row, width)]
+    if len(cells) < width:
+        cells.extend([""] * (width - len(cells)))
+    return cells
+
+
+def _row_template(headers: List[str], rows: List[List[str]], min_width: int) -> str:
+    """Build the printf-style template shared by every line of a table
 
     Args:
         headers: List of column headers
-        rows: List of rows (each row is a list of strings)
+        rows: Rows already passed through _row_cells
         min_width: Minimum column width
 
     Returns:
-        Formatted table string
+        Template with one left-aligned field per column
+    """
+    # Calculate column widths column-wise with C-level builtins
+    col_widths = [
+        max(min_width, len(h), max(map(len, col), default=0))
+        for h, col in zip(headers, zip(*rows))
+    ]
+    return " ".join("%-" + str(w) + "s" for w in col_widths)
+
+
+def iter_table_lines(headers: List[str], rows: List[List[str]], min_width: int = 10) -> Iterator[str]:
+    """Yield the lines of a formatted table one at a time
+
+    Args:
+        headers: List of column headers
+        rows: List of rows (each row is a list of strings)
+        min_width: Minimum column width
+
+    Yields:
+        Header line, separator line, then one line per row
     """
     if not headers or not rows:
-        return ""
+        return
 
-    # Calculate column widths
-    col_widths = [max(len(h), min_width) for h in headers]
+    width = len(headers)
+    rows_as_str = [_row_cells(row, width) for row in rows]
+    fmt = _row_template(headers, rows_as_str, min_width)
 
-    for row in rows:
-        for i, cell in enumerate(row):
-            if i < len(col_widths):
-                col_widths[i] = max(col_widths[i], len(str(cell)))
+    header_line = fmt % tuple(headers)
+    yield header_line
+    yield "-" * len(header_line)
 
-    # Build header
-    header_line = " ".join(h.ljust(col_widths[i]) for i, h in enumerate(headers))
-    separator = "-" * len(header_line)
+    for row in rows_as_str:
+        yield fmt % tuple(row)
 
-    # Build rows
-    table_rows = []
-    for row in rows:
-        table_row = " ".join(str(cell).ljust(col_widths[i]) for i, cell in enumerate(row))
-        table_rows.append(table_row)
 
-    # Combine
-    table = [header_line, separator] + table_rows
+def format_table(headers: List[str], rows: List[List[str]], min_width: int = 10) -> str:
+    """Format data as a table
+
+    Args:
+        headers: List of column headers
+        rows: List of rows (each row is a list of strings)
+        min_width: Minimum column width
 
-    return "\n".join(table)
+    Returns:
+        Formatted table string
+    """
+    return "\n".join(iter_table_lines(headers, rows, min_width))
 
 
 def print_table(headers: List[str], rows: List[List[str]], min_width: int = 10):
-    """Print formatted table
+    """Print formatted table line by line
 
     Args:
         headers: List of column headers
         rows: List of rows (each row is a list of strings)
         min_width: Minimum column width
     """
-    table = format_table(headers, rows, min_width)
-    if table:
-        print(table)
+    write = sys.stdout.write
+    for line in iter_table_lines(headers, rows, min_width):
+        write(line)
+        write("\n")
+    sys.stdout.flush()
+
+
+def stream_table(headers: List[str], rows: Iterable[List[str]], min_width: int = 10,
+                 sample_size: int = 128):
+    """Print a table row by row without materializing all rows
+
+    Column widths are computed from the first sample_size rows only; cells in
+    later rows that are wider than their column are printed in full.
+
+    Args:
+        headers: List of column headers
+        rows: Iterable of rows (each row is a list of strings)
+        min_width: Minimum column width
+        sample_size: Number of leading rows used to size the columns
+    """
+    rows = iter(rows)
+    sample = list(islice(rows, sample_size))
+    if not headers or not sample:
+        return
+
+    # Size the columns from the sample
+    width = len(headers)
+    sample = [_row_cells(row, width) for row in sample]
+    fmt = _row_template(headers, sample, min_width)
+
+    write = sys.stdout.write
+    header_line = fmt % tuple(headers)
+    write(header_line)
+    write("\n")
+    write("-" * len(header_line))
+    write("\n")
+
+    # Print rows as they are produced
+    for row in chain(sample, (_row_cells(row, width) for row in rows)):
+        write(fmt % tuple(row))
+        write("\n")
+    sys.stdout.flush()
@@ -1,6 +1,28 @@
 """
 Formatting utilities for Dockyard CLI
 """
+import os
+import sys
+from contextlib import contextmanager
+
+# Erase display + cursor home
+CLEAR_SCREEN = '\033[2J\033[H'
+
+# Cursor home + clear to end of screen; redraws in place without pushing
+# the previous frame into scrollback
+REDRAW_SCREEN = '\033[H\033[J'
+
+_ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+
+# Whether the console accepts escape sequences (None = not yet checked)
+_vt_enabled = None
+
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+_MAX_UNIT = len(_BYTE_UNITS) - 1
+
+# Pending escape sequences while inside batched_ansi()
+_ansi_buf = []
+_ansi_depth = 0
 
 
 def format_bytes(bytes_value: int) -> str:
@@ -12,11 +34,12 @@ def format_bytes(bytes_value: int) -> str:
     Returns:
         Human-readable string (e.g., "1.5GB")
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_value < 1024.0:
-            return f"{bytes_value:.1f}{unit}"
-        bytes_value /= 1024.0
-    return f"{bytes_value:.1f}PB"
+    if bytes_value < 1024:
+        return f"{bytes_value:.1f}B"
+
+    # Each unit is 2**10 of the previous one, so the bit length picks it
+    idx = min((int(bytes_value).bit_length() - 1) // 10, _MAX_UNIT)
+    return f"{bytes_value / (1 << (idx * 10)):.1f}{_BYTE_UNITS[idx]}"
 
 
 def truncate_string(s: str, max_length: int = 30) -> str:
@@ -34,10 +57,93 @@ def truncate_string(s: str, max_length: int = 30) -> str:
     return s[:max_length - 3] + "..."
 
 
+def _enable_vt_mode() -> bool:
+    """Enable ANSI escape processing on the Windows console
+
+    Returns:
+        True if the console understands escape sequences
+    """
+    global _vt_enabled
+    if _vt_enabled is None:
+        if os.name != 'nt':
+            _vt_enabled = True
+        else:
+            try:
+                import ctypes
+                from ctypes import wintypes
+                from cli.utils.win32 import STD_OUTPUT_HANDLE, kernel32 as load_kernel32
+                kernel32 = load_kernel32()
+                handle = kernel32.GetStdHandle(STD_OUTPUT_HANDLE)
+                mode = wintypes.DWORD()
+                _vt_enabled = bool(
+                    kernel32.GetConsoleMode(handle, ctypes.byref(mode))
+                    and kernel32.SetConsoleMode(handle, mode.value | _ENABLE_VIRTUAL_TERMINAL_PROCESSING)
+                )
+            except Exception:
+                _vt_enabled = False
+    return _vt_enabled
+
+
 def clear_screen():
-    """Clear terminal screen"""
-    import os
-    os.system('cls' if os.name == 'nt' else 'clear')
+    """Clear terminal screen
+
+    Inside batched_ansi() the escape sequence is deferred with the rest of
+    the frame.
+    """
+    if _enable_vt_mode():
+        write_ansi(CLEAR_SCREEN)
+    else:
+        # Legacy Windows console without escape sequence support; emit
+        # anything batched so far first, so the order of output is kept
+        flush_ansi()
+        os.system('cls')
+
+
+def redraw_screen():
+    """Move the cursor home and clear below it before redrawing a frame
+
+    Meant for periodic redraws; consoles without escape sequence support
+    get each frame appended instead of a cls per redraw.
+    """
+    if _enable_vt_mode():
+        write_ansi(REDRAW_SCREEN)
+
+
+def write_ansi(text: str):
+    """Write terminal output, deferring it while inside batched_ansi()
+
+    Args:
+        text: Escape sequence or text to write
+    """
+    if _ansi_depth:
+        _ansi_buf.append(text)
+    else:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+
+def flush_ansi():
+    """Write all pending escape sequences with a single write"""
+    if _ansi_buf:
+        sys.stdout.write("".join(_ansi_buf))
+        _ansi_buf.clear()
+    sys.stdout.flush()
+
+
+@contextmanager
+def batched_ansi():
+    """Collect terminal writes and emit them together on exit
+
+    Nested blocks flush only when the outermost one exits.
+    """
+    global _ansi_depth
+    _ansi_depth += 1
+    try:
+        yield
+    finally:
+        _ansi_depth -= 1
+        if not _ansi_depth:
+            flush_ansi()
 
 
 def move_cursor_up(lines: int = 1):
@@ -46,19 +152,19 @@ def move_cursor_up(lines: int = 1):
     Args:
         lines: Number of lines to move up
     """
-    print(f'\033[{lines}A', end='')
+    write_ansi(f'\033[{lines}A')
 
 
 def clear_line():
     """Clear current line"""
-    print('\033[2K', end='')
+    write_ansi('\033[2K')
 
 
 def hide_cursor():
     """Hide terminal cursor"""
-    print('\033[?25l', end='')
+    write_ansi('\033[?25l')
 
 
 def show_cursor():
     """Show terminal cursor"""
-    print('\033[?25h', end='')
+    write_ansi('\033[?25h')
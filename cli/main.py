@@ -4,14 +4,10 @@ Dockyard CLI - Main entry point
 Refactored version with modular architecture
 """
 import click
+import os
 import sys
 
 from cli.config import CLIConfig
-from cli.client.grpc_client import DockyardClient
-from cli.commands.container import ContainerCommands
-from cli.commands.exec import ExecCommand
-from cli.commands.logs import LogsCommand
-from cli.commands.stats import StatsCommand
 from cli.utils.exceptions import ConnectionException, AuthenticationException
 
 
@@ -19,6 +15,24 @@ from cli.utils.exceptions import ConnectionException, AuthenticationException
 pass_config = click.make_pass_decorator(dict, ensure=True)
 
 
+class _CommandContext(dict):
+    """ctx.obj whose client and command objects are created on first lookup
+
+    click runs the group callback before parsing the subcommand, so
+    `<command> --help` and `config` commands would otherwise load grpc and
+    the generated protos too.
+    """
+
+    def __init__(self, config, build):
+        super().__init__(config=config)
+        self._build = build
+
+    def __missing__(self, key):
+        objects = self._build()
+        self.update(objects)
+        return objects[key]
+
+
 @click.group()
 @click.option('--host', help='Agent hostname')
 @click.option('--port', type=int, help='Agent port')
@@ -28,30 +42,48 @@ def cli(ctx, host, port):
     # Load configuration
     config = CLIConfig()
 
+    # An explicitly chosen port always means TCP, even for a local agent
+    explicit_port = port is not None or 'DOCKYARD_PORT' in os.environ
+
     # Use provided options or fall back to config
     host = host or config.default_host
     port = port or config.default_port
 
-    # Create client
-    try:
-        client = DockyardClient(host, port, timeout=config.timeout)
-        ctx.obj = {
-            'config': config,
-            'client': client,
-            'container_commands': ContainerCommands(client),
-            'exec_command': ExecCommand(client),
-            'logs_command': LogsCommand(client),
-            'stats_command': StatsCommand(client)
-        }
-    except AuthenticationException as e:
-        click.echo(f"Authentication error: {e}", err=True)
-        click.echo("\nTo authenticate, set your token:", err=True)
-        click.echo("  export DOCKYARD_AUTH_TOKEN='your-token'", err=True)
-        click.echo("  or configure in ~/.dockyard/config.yaml", err=True)
-        sys.exit(1)
-    except ConnectionException as e:
-        click.echo(f"Connection error: {e}", err=True)
-        sys.exit(1)
+    def build():
+        # Deferred until a command needs the agent, so grpc and the
+        # generated protos are only loaded for commands that make an RPC
+        from cli.client.grpc_client import DockyardClient
+        from cli.commands.container import ContainerCommands
+        from cli.commands.exec import ExecCommand
+        from cli.commands.logs import LogsCommand
+        from cli.commands.stats import StatsCommand
+
+        # Create client
+        try:
+            client = DockyardClient(
+                host, port,
+                timeout=config.timeout,
+                config=config,
+                use_unix_socket=not explicit_port
+            )
+            return {
+                'client': client,
+                'container_commands': ContainerCommands(client),
+                'exec_command': ExecCommand(client),
+                'logs_command': LogsCommand(client),
+                'stats_command': StatsCommand(client)
+            }
+        except AuthenticationException as e:
+            click.echo(f"Authentication error: {e}", err=True)
+            click.echo("\nTo authenticate, set your token:", err=True)
+            click.echo("  export DOCKYARD_AUTH_TOKEN='your-token'", err=True)
+            click.echo("  or configure in ~/.dockyard/config.yaml", err=True)
+            sys.exit(1)
+        except ConnectionException as e:
+            click.echo(f"Connection error: {e}", err=True)
+            sys.exit(1)
+
+    ctx.obj = _CommandContext(config, build)
 
 
 # Container Management Commands
@@ -1,16 +1,14 @@
 #!/usr/bin/env python3
 import sys
 import os
+import re
 import click
-import grpc
-import yaml
+import queue
+import selectors
 import threading
-import time
-from pathlib import Path
 
 # Platform-specific imports
 try:
-    import select
     import tty
     import termios
     HAS_TERMIOS = True
@@ -23,19 +21,198 @@ try:
 except ImportError:
     HAS_MSVCRT = False
 
-# Add parent directory to path for proto imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent directory to path for proto imports when run as a script;
+# importing through the cli package has already done this
+if not __package__:
+    _PROTO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if _PROTO_DIR not in sys.path:
+        sys.path.append(_PROTO_DIR)
 
-import dockyard_pb2
-import dockyard_pb2_grpc
+from cli.utils.output import OutputBuffer
+
+# grpc and the generated protos are imported where they are used so that
+# --help and argument errors do not pay for loading them
+
+# Seconds the first RPC waits for the channel to connect
+CONNECT_TIMEOUT = 2
+
+# Relative --since value for logs (e.g. 30m); \Z so "1h\n" is rejected
+_SINCE_RE = re.compile(r'^\d+[smhd]\Z')
+
+# Win32 wait result when the console input handle is signalled
+WAIT_OBJECT_0 = 0
+
+# StopContainer calls kept in flight by the stop command
+MAX_CONCURRENT_STOPS = 32
+
+# RPC deadlines in seconds. Launch may pull an image; streaming calls that
+# follow output have no deadline
+UNARY_DEADLINE = 30
+LAUNCH_DEADLINE = 300
+LOGS_DEADLINE = 60
+
+# Maximum stdin bytes read at once and sent in a single ExecInput
+STDIN_READ_SIZE = 4096
+
+# Upper bound on stdin bytes coalesced into one ExecInput
+STDIN_MAX_MESSAGE = 64 * 1024
+
+# Stdin chunks that may wait to be sent before reading pauses (64 x 4KiB)
+INPUT_QUEUE_SIZE = 64
+
+
+def _stop_deadline(timeout):
+    """Deadline for a StopContainer call that waits up to timeout seconds"""
+    return max(timeout + 5, UNARY_DEADLINE)
+
+
+def _batch_stop_deadline(timeout, count):
+    """Deadline for a BatchStop call, even if the agent stops one at a time"""
+    return max(timeout * count + 5, UNARY_DEADLINE)
+
+
+def _put(input_queue, item, stop_event):
+    """Queue an item, blocking while the queue is full unless stopped"""
+    while not stop_event.is_set():
+        try:
+            input_queue.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _discard_console_events(kernel32, handle):
+    """Drop queued console records up to the first key press msvcrt will read
+
+    Mouse, focus and key-up records signal the input handle without making
+    kbhit() true; they are removed one at a time so that a key arriving
+    meanwhile is never lost.
+    """
+    import ctypes
+    from ctypes import wintypes
+    from cli.utils.win32 import INPUT_RECORD, KEY_EVENT
+
+    record = INPUT_RECORD()
+    count = wintypes.DWORD()
+    while kernel32.PeekConsoleInputW(handle, ctypes.byref(record), 1, ctypes.byref(count)) and count.value:
+        if record.EventType == KEY_EVENT and record.Event.KeyEvent.bKeyDown and msvcrt.kbhit():
+            return
+        kernel32.ReadConsoleInputW(handle, ctypes.byref(record), 1, ctypes.byref(count))
+
+
+def _read_stdin(input_queue, stop_event):
+    """Read stdin chunks into input_queue until stop_event is set
+
+    A None item is queued if stdin fails so the request stream can end.
+    """
+    try:
+        if HAS_TERMIOS and sys.platform != 'win32':
+            # Unix: wait on stdin with the platform's native poller
+            # (epoll on Linux) instead of select() per iteration
+            stdin_fd = sys.stdin.fileno()
+            with selectors.DefaultSelector() as selector:
+                try:
+                    selector.register(stdin_fd, selectors.EVENT_READ)
+                    pollable = True
+                except (ValueError, OSError):
+                    pollable = False  # Regular file: cannot be polled, never blocks
+
+                # Bind the loop's calls to locals
+                stopped = stop_event.is_set
+                wait = selector.select
+                read = os.read
+
+                while not stopped():
+                    if pollable and not wait(0.1):
+                        continue
+
+                    # Send everything that is available as one message
+                    data = read(stdin_fd, STDIN_READ_SIZE)
+                    if not data:
+                        return  # stdin closed, keep session open
+
+                    # A full read means more may be waiting (e.g. a paste);
+                    # drain it without blocking, up to STDIN_MAX_MESSAGE
+                    if len(data) == STDIN_READ_SIZE:
+                        pending = bytearray(data)
+                        while len(pending) < STDIN_MAX_MESSAGE and (not pollable or wait(0)):
+                            chunk = read(stdin_fd, STDIN_READ_SIZE)
+                            pending += chunk
+                            if len(chunk) < STDIN_READ_SIZE:
+                                break
+                        data = bytes(pending)
+                    if not _put(input_queue, data, stop_event):
+                        return
+        elif HAS_MSVCRT:
+            # Windows: block on the console input handle instead of polling
+            from cli.utils.win32 import STD_INPUT_HANDLE, kernel32 as load_kernel32
+            kernel32 = load_kernel32()
+            stdin_handle = kernel32.GetStdHandle(STD_INPUT_HANDLE)
+
+            while not stop_event.is_set():
+                # Time out periodically only to notice stop_event
+                if kernel32.WaitForSingleObject(stdin_handle, 100) != WAIT_OBJECT_0:
+                    continue
+
+                if not msvcrt.kbhit():
+                    # Signalled by mouse/focus/key-up events; discard them so
+                    # the handle does not stay signalled
+                    _discard_console_events(kernel32, stdin_handle)
+                    continue
+
+                # Send every pending key as one message
+                data = bytearray()
+                while msvcrt.kbhit():
+                    data += msvcrt.getch()
+                if not _put(input_queue, bytes(data), stop_event):
+                    return
+    except (OSError, ValueError):
+        _put(input_queue, None, stop_event)
 
 
 class DockyardClient:
     def __init__(self, host='localhost', port=50051):
-        self.channel = grpc.insecure_channel(f'{host}:{port}')
-        self.stub = dockyard_pb2_grpc.DockyardServiceStub(self.channel)
+        # The channel is opened on the first RPC, so --help and argument
+        # errors neither load grpc nor wait on an unreachable agent
+        self.target = f'{host}:{port}'
+        self.channel = None
+        self._stub = None
+        self._ready = None
+
+    @property
+    def stub(self):
+        """Service stub, opening the shared channel on first use"""
+        if self._stub is None:
+            import dockyard_pb2_grpc
+            from cli.client.grpc_client import acquire_channel
+
+            self.channel = acquire_channel(self.target)
+            self._stub = dockyard_pb2_grpc.DockyardServiceStub(self.channel)
+        return self._stub
+
+    @property
+    def ready(self):
+        """Whether the agent accepted a connection
+
+        Checked once, on first use: a channel that is already connected
+        returns at once, otherwise this waits up to CONNECT_TIMEOUT.
+        """
+        if self._ready is None:
+            import grpc
+
+            self.stub  # Open the channel
+            try:
+                grpc.channel_ready_future(self.channel).result(timeout=CONNECT_TIMEOUT)
+                self._ready = True
+            except grpc.FutureTimeoutError:
+                self._ready = False
+        return self._ready
 
     def launch_container(self, image=None, name=None, config_file=None):
+        import grpc
+        import dockyard_pb2
+
         request = dockyard_pb2.LaunchRequest(
             image=image or '',
             name=name or '',
@@ -43,13 +220,18 @@ class DockyardClient:
         )
 
         try:
-            response = self.stub.LaunchContainer(request)
+            response = self.stub.LaunchContainer(
+                request, timeout=LAUNCH_DEADLINE, wait_for_ready=self.ready
+            )
             return response
         except grpc.RpcError as e:
             click.echo(f"Error: Failed to connect to agent - {e.details()}", err=True)
             return None
 
     def stop_container(self, container_identifier, force=False, timeout=10):
+        import grpc
+        import dockyard_pb2
+
         request = dockyard_pb2.StopRequest(
             container_identifier=container_identifier,
             force=force,
@@ -57,27 +239,91 @@ class DockyardClient:
         )
 
         try:
-            response = self.stub.StopContainer(request)
+            response = self.stub.StopContainer(
+                request, timeout=_stop_deadline(timeout), wait_for_ready=self.ready
+            )
             return response
         except grpc.RpcError as e:
             click.echo(f"Error: Failed to connect to agent - {e.details()}", err=True)
             return None
 
+    def stop_container_async(self, container_identifier, force=False, timeout=10):
+        """Start a StopContainer call without waiting for its result"""
+        import dockyard_pb2
+
+        request = dockyard_pb2.StopRequest(
+            container_identifier=container_identifier,
+            force=force,
+            timeout=timeout
+        )
+        return self.stub.StopContainer.future(
+            request, timeout=_stop_deadline(timeout), wait_for_ready=self.ready
+        )
+
+    def batch_stop(self, container_identifiers, on_response, force=False, timeout=10):
+        """Stop containers over a single BatchStop stream
+
+        on_response(container_identifier, response) is called for each
+        container as the agent reports it stopped.
+
+        Returns:
+            False if the agent does not implement BatchStop, else True
+        """
+        import grpc
+        import dockyard_pb2
+
+        batch_stop = getattr(self.stub, 'BatchStop', None)
+        if batch_stop is None:
+            return False  # Generated stubs predate BatchStop
+
+        requests = [
+            dockyard_pb2.StopRequest(container_identifier=c, force=force, timeout=timeout)
+            for c in container_identifiers
+        ]
+
+        try:
+            for response in batch_stop(
+                iter(requests),
+                timeout=_batch_stop_deadline(timeout, len(requests)),
+                wait_for_ready=self.ready
+            ):
+                on_response(response.container_identifier, response)
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.UNIMPLEMENTED:
+                return False
+            click.echo(f"Error: Failed to connect to agent - {e.details()}", err=True)
+        return True
+
+    def wait_for(self, future):
+        """Wait for an asynchronous call, returning None on failure"""
+        import grpc
+
+        try:
+            return future.result()
+        except grpc.RpcError as e:
+            click.echo(f"Error: Failed to connect to agent - {e.details()}", err=True)
+            return None
+
     def exec_container(self, container_identifier, command, interactive=False, user=None, working_dir=None, environment=None):
         """Execute a command in a container with streaming support"""
+        import grpc
+        import dockyard_pb2
+
+        # Build the initial ExecStart request up front
+        exec_start = dockyard_pb2.ExecStart(
+            container_identifier=container_identifier,
+            command=command,
+            interactive=interactive,
+            user=user or '',
+            working_dir=working_dir or '',
+            environment=environment or {}
+        )
+        start_request = dockyard_pb2.ExecRequest(start=exec_start)
+
         try:
             def generate_requests():
                 # Send initial ExecStart request
-                exec_start = dockyard_pb2.ExecStart(
-                    container_identifier=container_identifier,
-                    command=command,
-                    interactive=interactive,
-                    user=user or '',
-                    working_dir=working_dir or '',
-                    environment=environment or {}
-                )
-
-                yield dockyard_pb2.ExecRequest(start=exec_start)
+                yield start_request
 
                 # For interactive mode, handle stdin input
                 if interactive:
@@ -90,37 +336,35 @@ class DockyardClient:
                     except:
                         pass  # Not a TTY
 
+                    # A reader thread feeds stdin through a bounded queue, so
+                    # input stalls at the terminal instead of piling up in
+                    # gRPC's send buffers when the agent is slow to consume it
+                    input_queue = queue.Queue(maxsize=INPUT_QUEUE_SIZE)
+                    stop_event = threading.Event()
+                    reader = threading.Thread(
+                        target=_read_stdin, args=(input_queue, stop_event), daemon=True
+                    )
+                    reader.start()
+
+                    # One input request reused for every chunk: gRPC serializes
+                    # each request before asking the generator for the next
+                    input_request = dockyard_pb2.ExecRequest(input=dockyard_pb2.ExecInput())
+                    exec_input = input_request.input
+
                     try:
                         while True:
-                            # Use platform-specific input handling
-                            if HAS_TERMIOS and sys.platform != 'win32':
-                                # Unix/Linux
-                                ready, _, _ = select.select([sys.stdin], [], [], 0.1)
-                                if ready:
-                                    data = sys.stdin.read(1).encode('utf-8')
-                                    if data:
-                                        yield dockyard_pb2.ExecRequest(
-                                            input=dockyard_pb2.ExecInput(data=data)
-                                        )
-                            elif HAS_MSVCRT:
-                                # Windows
-                                if msvcrt.kbhit():
-                                    data = msvcrt.getch()
-                                    if data:
-                                        yield dockyard_pb2.ExecRequest(
-                                            input=dockyard_pb2.ExecInput(data=data)
-                                        )
-                                else:
-                                    time.sleep(0.1)  # Prevent busy waiting
-                            else:
-                                # Fallback for unsupported platforms
-                                time.sleep(0.1)
+                            data = input_queue.get()
+                            if data is None:
+                                break
+                            exec_input.data = data
+                            yield input_request
                     except KeyboardInterrupt:
                         # Send Ctrl+C to container
-                        yield dockyard_pb2.ExecRequest(
-                            input=dockyard_pb2.ExecInput(data=b'\x03')
-                        )
+                        exec_input.data = b'\x03'
+                        yield input_request
                     finally:
+                        stop_event.set()
+
                         # Restore terminal settings
                         if old_settings and HAS_TERMIOS:
                             try:
@@ -129,15 +373,21 @@ class DockyardClient:
                                 pass
 
             # Start streaming
-            response_stream = self.stub.ExecContainer(generate_requests())
+            response_stream = self.stub.ExecContainer(
+                generate_requests(), wait_for_ready=self.ready
+            )
             return response_stream
 
         except grpc.RpcError as e:
             click.echo(f"Error: Failed to connect to agent - {e.details()}", err=True)
             return None
 
-    def get_logs(self, container_identifier, follow=False, tail=0, since=None, timestamps=False, stdout=True, stderr=True):
+    def get_logs(self, container_identifier, follow=False, tail=0, since=None, timestamps=False, stdout=True, stderr=True,
+                 compress=False):
         """Get container logs with streaming support"""
+        import grpc
+        import dockyard_pb2
+
         request = dockyard_pb2.LogsRequest(
             container_identifier=container_identifier,
             follow=follow,
@@ -145,11 +395,16 @@ class DockyardClient:
             since=since or '',
             timestamps=timestamps,
             stdout=stdout,
-            stderr=stderr
+            stderr=stderr,
+            compress=compress
         )
 
         try:
-            response_stream = self.stub.GetLogs(request)
+            response_stream = self.stub.GetLogs(
+                request,
+                timeout=None if follow else LOGS_DEADLINE,
+                wait_for_ready=self.ready
+            )
             return response_stream
         except grpc.RpcError as e:
             click.echo(f"Error: Failed to connect to agent - {e.details()}", err=True)
@@ -157,10 +412,15 @@ class DockyardClient:
 
     def list_containers(self, all_containers=False):
         """List containers with optional showing of all"""
+        import grpc
+        import dockyard_pb2
+
         request = dockyard_pb2.ListContainersRequest(all=all_containers)
 
         try:
-            response = self.stub.ListContainers(request)
+            response = self.stub.ListContainers(
+                request, timeout=UNARY_DEADLINE, wait_for_ready=self.ready
+            )
             return response
         except grpc.RpcError as e:
             click.echo(f"Error: Failed to connect to agent - {e.details()}", err=True)
@@ -168,12 +428,17 @@ class DockyardClient:
 
     def inspect_container(self, container_identifier):
         """Get detailed container information"""
+        import grpc
+        import dockyard_pb2
+
         request = dockyard_pb2.InspectContainerRequest(
             container_identifier=container_identifier
         )
 
         try:
-            response = self.stub.InspectContainer(request)
+            response = self.stub.InspectContainer(
+                request, timeout=UNARY_DEADLINE, wait_for_ready=self.ready
+            )
             return response
         except grpc.RpcError as e:
             click.echo(f"Error: Failed to connect to agent - {e.details()}", err=True)
@@ -181,13 +446,18 @@ class DockyardClient:
 
     def remove_container(self, container_identifier, force=False):
         """Remove a container"""
+        import grpc
+        import dockyard_pb2
+
         request = dockyard_pb2.RemoveContainerRequest(
             container_identifier=container_identifier,
             force=force
         )
 
         try:
-            response = self.stub.RemoveContainer(request)
+            response = self.stub.RemoveContainer(
+                request, timeout=UNARY_DEADLINE, wait_for_ready=self.ready
+            )
             return response
         except grpc.RpcError as e:
             click.echo(f"Error: Failed to connect to agent - {e.details()}", err=True)
@@ -195,20 +465,28 @@ class DockyardClient:
 
     def get_stats(self, container_identifiers=None, stream=True):
         """Get container statistics"""
+        import grpc
+        import dockyard_pb2
+
         request = dockyard_pb2.StatsRequest(
             container_identifiers=container_identifiers or [],
             stream=stream
         )
 
         try:
-            response_stream = self.stub.GetStats(request)
+            response_stream = self.stub.GetStats(request, wait_for_ready=self.ready)
             return response_stream
         except grpc.RpcError as e:
             click.echo(f"Error: Failed to connect to agent - {e.details()}", err=True)
             return None
 
     def close(self):
-        self.channel.close()
+        from cli.client.grpc_client import release_channel
+
+        if self.channel is not None:
+            self.channel = None
+            self._stub = None
+            release_channel(self.target)
 
 
 @click.group()
@@ -243,7 +521,7 @@ def launch(ctx, image, name, config_file):
         click.echo("Error: Either provide an image or a config file (-f)", err=True)
         sys.exit(1)
 
-    if config_file and not Path(config_file).exists():
+    if config_file and not os.path.exists(config_file):
         click.echo(f"Error: Config file not found: {config_file}", err=True)
         sys.exit(1)
 
@@ -286,28 +564,65 @@ def stop(ctx, containers, force, timeout):
     # Handle multiple containers
     failed_containers = []
     stopped_containers = []
+    unreported = list(containers)
 
-    for container in containers:
-        click.echo(f"Stopping container '{container}'...")
+    # Per-container lines go straight to the streams rather than through
+    # click.echo, which re-inspects the stream on every call
+    out = sys.stdout
+    err = sys.stderr
 
-        response = client.stop_container(
-            container_identifier=container,
-            force=force,
-            timeout=timeout
-        )
+    def report(container, response):
+        if container in unreported:
+            unreported.remove(container)
 
         if response:
             if response.success:
-                click.echo(f"Success: {response.message}")
-                stopped_containers.append(container)
+                line = f"Success: {response.message}\n"
                 if response.container_id:
-                    click.echo(f"Container ID: {response.container_id}")
+                    line += f"Container ID: {response.container_id}\n"
+                out.write(line)
+                out.flush()
+                stopped_containers.append(container)
             else:
-                click.echo(f"Failed to stop '{container}': {response.message}", err=True)
+                err.write(f"Failed to stop '{container}': {response.message}\n")
+                err.flush()
                 failed_containers.append(container)
         else:
             failed_containers.append(container)
 
+    out.write("".join(f"Stopping container '{c}'...\n" for c in containers))
+    out.flush()
+
+    # Stop everything over one BatchStop stream; agents without BatchStop
+    # get concurrent per-container StopContainer calls instead
+    if not client.batch_stop(containers, report, force=force, timeout=timeout):
+        # Keep at most MAX_CONCURRENT_STOPS calls in flight on the shared
+        # channel and report each one as it finishes
+        done = queue.Queue()
+        pending = iter(containers)
+
+        def start_next():
+            container = next(pending, None)
+            if container is None:
+                return
+            future = client.stop_container_async(
+                container_identifier=container,
+                force=force,
+                timeout=timeout
+            )
+            future.add_done_callback(lambda f, c=container: done.put((c, f)))
+
+        for _ in range(min(MAX_CONCURRENT_STOPS, len(containers))):
+            start_next()
+
+        for _ in range(len(containers)):
+            container, future = done.get()
+            start_next()
+            report(container, client.wait_for(future))
+
+    # Containers the batch stream ended without reporting
+    failed_containers.extend(unreported)
+
     # Summary for batch operations
     if len(containers) > 1:
         click.echo(f"\nSummary: {len(stopped_containers)} stopped, {len(failed_containers)} failed")
@@ -366,6 +681,10 @@ def exec(ctx, container, command, interactive, user, workdir, env):
     if command:
         click.echo(f"Command: {' '.join(command)}")
 
+    # Batch output instead of flushing every frame; interactive sessions
+    # still show each frame immediately
+    out_buf = OutputBuffer(immediate=interactive, line_flush=sys.stdout.isatty())
+
     try:
         # Get response stream
         response_stream = client.exec_container(
@@ -384,15 +703,19 @@ def exec(ctx, container, command, interactive, user, workdir, env):
         exec_started = False
 
         # Handle responses
+        write = out_buf.write
         for response in response_stream:
-            if response.HasField('status'):
+            kind = response.WhichOneof('response_type')
+            if kind == 'status':
                 status = response.status
                 if not status.success:
+                    out_buf.flush()
                     click.echo(f"Error: {status.message}", err=True)
                     sys.exit(1)
 
                 if status.finished:
                     exit_code = status.exit_code
+                    out_buf.flush()
                     if not exec_started:
                         # Only show completion message if we haven't shown any output
                         click.echo(f"Command completed with exit code {exit_code}")
@@ -400,18 +723,13 @@ def exec(ctx, container, command, interactive, user, workdir, env):
                 elif not exec_started:
                     exec_started = True
 
-            elif response.HasField('output'):
+            elif kind == 'output':
                 output = response.output
-                data = output.data
 
-                # Write output directly to stdout/stderr
-                if output.stream_type == 'stderr':
-                    sys.stderr.buffer.write(data)
-                    sys.stderr.buffer.flush()
-                else:
-                    sys.stdout.buffer.write(data)
-                    sys.stdout.buffer.flush()
+                # Queue output for stdout/stderr
+                write(output.data, stderr=output.stream_type == 'stderr')
 
+        out_buf.flush()
         client.close()
 
         # Exit with the same code as the command
@@ -419,10 +737,12 @@ def exec(ctx, container, command, interactive, user, workdir, env):
             sys.exit(exit_code)
 
     except KeyboardInterrupt:
+        out_buf.flush()
         click.echo("\nExecution interrupted by user")
         client.close()
         sys.exit(130)  # Standard exit code for Ctrl+C
     except Exception as e:
+        out_buf.flush()
         click.echo(f"Unexpected error: {e}", err=True)
         client.close()
         sys.exit(1)
@@ -436,8 +756,9 @@ def exec(ctx, container, command, interactive, user, workdir, env):
 @click.option('--timestamps', '-t', is_flag=True, help='Show timestamps')
 @click.option('--no-stdout', is_flag=True, help='Do not include stdout')
 @click.option('--no-stderr', is_flag=True, help='Do not include stderr')
+@click.option('--compress', is_flag=True, help='Gzip-compress the log stream (useful over slow links)')
 @click.pass_context
-def logs(ctx, container, follow, tail, since, timestamps, no_stdout, no_stderr):
+def logs(ctx, container, follow, tail, since, timestamps, no_stdout, no_stderr, compress):
     """View container logs
 
     Examples:
@@ -463,11 +784,9 @@ def logs(ctx, container, follow, tail, since, timestamps, no_stdout, no_stderr):
         sys.exit(1)
 
     # Validate since format if provided
-    if since:
-        import re
-        if not re.match(r'^\d+[smhd]$', since):
-            click.echo("Error: Invalid since format. Use format like '1h', '30m', '10s', '7d'", err=True)
-            sys.exit(1)
+    if since and not _SINCE_RE.match(since):
+        click.echo("Error: Invalid since format. Use format like '1h', '30m', '10s', '7d'", err=True)
+        sys.exit(1)
 
     click.echo(f"{'Following' if follow else 'Getting'} logs for container '{container}'...")
 
@@ -476,6 +795,10 @@ def logs(ctx, container, follow, tail, since, timestamps, no_stdout, no_stderr):
     if since:
         click.echo(f"Logs since {since} ago")
 
+    # Followed logs show up immediately on a terminal and per line when
+    # piped; a one-shot dump is only flushed in large batches
+    out_buf = OutputBuffer(immediate=follow and sys.stdout.isatty(), line_flush=follow)
+
     try:
         # Get response stream
         response_stream = client.get_logs(
@@ -485,17 +808,21 @@ def logs(ctx, container, follow, tail, since, timestamps, no_stdout, no_stderr):
             since=since,
             timestamps=timestamps,
             stdout=stdout,
-            stderr=stderr
+            stderr=stderr,
+            compress=compress
         )
 
         if not response_stream:
             sys.exit(1)
 
         # Handle responses
+        write = out_buf.write
         for response in response_stream:
-            if response.HasField('status'):
+            kind = response.WhichOneof('response_type')
+            if kind == 'status':
                 status = response.status
                 if not status.success:
+                    out_buf.flush()
                     click.echo(f"Error: {status.message}", err=True)
                     sys.exit(1)
 
@@ -503,31 +830,28 @@ def logs(ctx, container, follow, tail, since, timestamps, no_stdout, no_stderr):
                     # Non-follow mode completed
                     break
 
-            elif response.HasField('log'):
+            elif kind == 'log':
                 log_entry = response.log
                 data = log_entry.data
 
-                # Format output with optional coloring for stderr
-                if log_entry.stream_type == 'stderr':
-                    # Output to stderr
-                    if timestamps and log_entry.timestamp:
-                        sys.stderr.buffer.write(f"{log_entry.timestamp} ".encode('utf-8'))
-                    sys.stderr.buffer.write(data)
-                    sys.stderr.buffer.flush()
-                else:
-                    # Output to stdout
-                    if timestamps and log_entry.timestamp:
-                        sys.stdout.buffer.write(f"{log_entry.timestamp} ".encode('utf-8'))
-                    sys.stdout.buffer.write(data)
-                    sys.stdout.buffer.flush()
+                # Prefix the timestamp in the same write; it comes from the
+                # agent, so never let an odd character abort the stream
+                if timestamps and log_entry.timestamp:
+                    data = log_entry.timestamp.encode('utf-8', 'replace') + b' ' + data
+
+                # Route stderr entries to stderr
+                write(data, stderr=log_entry.stream_type == 'stderr')
 
+        out_buf.flush()
         client.close()
 
     except KeyboardInterrupt:
+        out_buf.flush()
         click.echo("\nLog streaming interrupted by user")
         client.close()
         sys.exit(130)  # Standard exit code for Ctrl+C
     except Exception as e:
+        out_buf.flush()
         click.echo(f"Unexpected error: {e}", err=True)
         client.close()
         sys.exit(1)
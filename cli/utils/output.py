@@ -0,0 +1,89 @@
+"""
+Buffered binary output for Dockyard CLI streaming commands
+"""
+import io
+import os
+import sys
+
+# Flush once this many bytes are pending
+DEFAULT_FLUSH_SIZE = 32 * 1024
+
+
+def _write_all(fd: int, data):
+    """Write all of data to a file descriptor
+
+    Args:
+        fd: File descriptor
+        data: Bytes-like object to write
+    """
+    with memoryview(data) as view:
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+
+
+def _fileno(stream) -> int:
+    """Get the file descriptor behind a stream, or -1 if it has none"""
+    try:
+        return stream.fileno()
+    except (AttributeError, ValueError, io.UnsupportedOperation):
+        return -1
+
+
+class OutputBuffer:
+    """Batches stdout/stderr writes so streams do not flush per message"""
+
+    def __init__(self, immediate: bool = False, line_flush: bool = False,
+                 flush_size: int = DEFAULT_FLUSH_SIZE):
+        """Initialize output buffer
+
+        Args:
+            immediate: Flush after every write (interactive output)
+            line_flush: Flush whenever written data contains a newline
+            flush_size: Pending byte count that triggers a flush
+        """
+        self.immediate = immediate
+        self.line_flush = line_flush
+        self.flush_size = flush_size
+        self._buffer = bytearray()
+        self._stream = None
+
+    def write(self, data: bytes, stderr: bool = False):
+        """Queue data for stdout or stderr
+
+        Switching between stdout and stderr flushes the pending data first
+        so the relative ordering of the two streams is preserved.
+
+        Args:
+            data: Bytes to write
+            stderr: Write to stderr instead of stdout
+        """
+        stream = sys.stderr if stderr else sys.stdout
+        if stream is not self._stream:
+            self.flush()
+            self._stream = stream
+
+        self._buffer += data
+
+        if (self.immediate
+                or len(self._buffer) >= self.flush_size
+                or (self.line_flush and b'\n' in data)):
+            self.flush()
+
+    def flush(self):
+        """Write pending data to its stream
+
+        Data goes straight to the stream's file descriptor with os.write,
+        skipping the BufferedWriter copy; anything already buffered on the
+        stream (e.g. click.echo output) is flushed first to keep ordering.
+        """
+        if self._buffer:
+            stream = self._stream
+            stream.flush()
+            fd = _fileno(stream)
+            if fd >= 0:
+                _write_all(fd, self._buffer)
+            else:
+                stream.buffer.write(self._buffer)
+                stream.flush()
+            self._buffer.clear()
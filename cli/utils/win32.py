@@ -0,0 +1,68 @@
+"""
+Typed kernel32 console functions for Dockyard CLI (Windows only)
+
+Only imported on Windows. Every function used gets explicit argtypes and
+restype, so 64-bit HANDLE values are never truncated to a C int.
+"""
+import ctypes
+from ctypes import wintypes
+
+STD_INPUT_HANDLE = -10
+STD_OUTPUT_HANDLE = -11
+
+# INPUT_RECORD.EventType of keyboard records
+KEY_EVENT = 0x0001
+
+
+class KEY_EVENT_RECORD(ctypes.Structure):
+    _fields_ = [
+        ('bKeyDown', wintypes.BOOL),
+        ('wRepeatCount', wintypes.WORD),
+        ('wVirtualKeyCode', wintypes.WORD),
+        ('wVirtualScanCode', wintypes.WORD),
+        ('uChar', wintypes.WCHAR),
+        ('dwControlKeyState', wintypes.DWORD),
+    ]
+
+
+class _EVENT(ctypes.Union):
+    # Every event record is at most 16 bytes
+    _fields_ = [('KeyEvent', KEY_EVENT_RECORD), ('_pad', ctypes.c_byte * 16)]
+
+
+class INPUT_RECORD(ctypes.Structure):
+    _fields_ = [('EventType', wintypes.WORD), ('Event', _EVENT)]
+
+
+# Loaded on first use by kernel32()
+_kernel32 = None
+
+
+def kernel32():
+    """Get a private kernel32 instance with the console signatures declared
+
+    A separate WinDLL is used so these signatures do not leak into the
+    shared ctypes.windll.kernel32.
+
+    Returns:
+        ctypes.WinDLL for kernel32
+    """
+    global _kernel32
+    if _kernel32 is None:
+        lib = ctypes.WinDLL('kernel32', use_last_error=True)
+        lib.GetStdHandle.argtypes = [wintypes.DWORD]
+        lib.GetStdHandle.restype = wintypes.HANDLE
+        lib.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+        lib.WaitForSingleObject.restype = wintypes.DWORD
+        lib.GetConsoleMode.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.DWORD)]
+        lib.GetConsoleMode.restype = wintypes.BOOL
+        lib.SetConsoleMode.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+        lib.SetConsoleMode.restype = wintypes.BOOL
+        for func in (lib.PeekConsoleInputW, lib.ReadConsoleInputW):
+            func.argtypes = [
+                wintypes.HANDLE, ctypes.POINTER(INPUT_RECORD),
+                wintypes.DWORD, ctypes.POINTER(wintypes.DWORD)
+            ]
+            func.restype = wintypes.BOOL
+        _kernel32 = lib
+    return _kernel32